@@ -4,38 +4,75 @@
 # univariate analysis (histograms, box plots), bivariate analysis (scatter plots, correlation heatmap),
 # and plotting the initial time series data.
 
+import os
+
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Set HEADLESS=1 to run without a display (e.g. in CI): figures are rendered with the
+# non-interactive Agg backend and saved to disk instead of being shown in GUI windows.
+# Empty, '0', 'false' and 'no' (any case) leave headless mode off.
+HEADLESS = os.environ.get('HEADLESS', '').strip().lower() not in ('', '0', 'false', 'no')
+if HEADLESS:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns # For heatmap visualization
 
-def generate_and_save_data(filename='time_series_dataset.csv'):
+# Matplotlib's built-in 'fast' style: maximal line path simplification
+# (path.simplify, path.simplify_threshold=1.0) and chunked rendering of long lines (agg.path.chunksize).
+plt.style.use('fast')
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional dependency: without it the kernels below run as plain Python/NumPy.
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    import polars as pl
+except ImportError:
+    # Polars is an optional dependency: without it descriptive statistics come from describe_block.
+    pl = None
+
+def generate_and_save_data(filename='time_series_dataset.csv', seed=42):
     """
     Generates a time series dataset with Date, Temperature, pH, and COD.
     Saves the dataset to a CSV file.
 
     Args:
         filename (str): The name of the CSV file to save the data to.
+        seed (int, optional): Seed for the random number generator, for reproducible data.
+                              Pass None to draw fresh entropy from the OS.
 
     Returns:
         pd.DataFrame: The generated time series data.
     """
-    # Generate date range from January 2013 to December 2020 with monthly frequency
-    date_range = pd.date_range(start='2013-01-01', end='2020-12-31', freq='M')
-
-    # Generate random temperatures between -5 and +35 degrees Celsius
-    temperatures = np.random.uniform(low=-5, high=35, size=len(date_range))
-
-    # Generate random pH values between 4 and 7
-    ph_values = np.random.uniform(low=4, high=7, size=len(date_range))
-    cod = np.random.uniform(low=0, high=4, size=len(date_range))
+    # Generate month-end dates from January 2013 to December 2020 with NumPy datetime arithmetic:
+    # the first day of the following month minus one day is the last day of each month.
+    # Second resolution is ample for monthly data (pandas supports s/ms/us/ns, not days) and avoids
+    # nanosecond arithmetic in date handling and plotting.
+    months = np.arange(np.datetime64('2013-01'), np.datetime64('2021-01'), np.timedelta64(1, 'M'))
+    date_range = ((months + np.timedelta64(1, 'M')).astype('datetime64[D]')
+                  - np.timedelta64(1, 'D')).astype('datetime64[s]')
+
+    # Draw all three columns in a single call: Temperature in [-5, 35) °C,
+    # pH in [4, 7) and COD in [0, 4). Each column is a view into one (n, 3) block.
+    # float32 is plenty of precision for these ranges and halves the memory footprint.
+    # A dedicated PCG64DXSM Generator is faster than the legacy global Mersenne Twister
+    # and does not share state with other code that uses np.random.
+    rng = np.random.Generator(np.random.PCG64DXSM(seed))
+    lows = np.array([-5, 4, 0], dtype=np.float32)
+    highs = np.array([35, 7, 4], dtype=np.float32)
+    data = lows + (highs - lows) * rng.random((len(date_range), 3), dtype=np.float32)
 
     # Create a DataFrame
     time_series_data = pd.DataFrame({
         'Date': date_range,
-        'Temperature': temperatures,
-        'pH': ph_values,
-        'cod': cod,
+        'Temperature': data[:, 0],
+        'pH': data[:, 1],
+        'cod': data[:, 2],
     })
 
     # Save the dataset to a CSV file
@@ -43,7 +80,166 @@ def generate_and_save_data(filename='time_series_dataset.csv'):
     print(f"Data saved to {filename}")
     return time_series_data
 
-def plot_initial_data(dataframe):
+@njit(cache=True)
+def describe_block(X):
+    """
+    Computes descriptive statistics for every column of a 2D array in a single compiled kernel.
+    The statistics match pandas' describe(): count, mean, std (ddof=1), min,
+    25%/50%/75% quantiles (linear interpolation) and max. Missing values (NaN) are skipped
+    and 'count' is the number of non-missing values per column.
+    With Numba, the first run pays a one-off compile cost of a few seconds (far more than describe()
+    takes on small frames); the compiled code is cached on disk, so later runs load it directly.
+
+    Args:
+        X (np.ndarray): 2D float64 array of shape (n, k).
+                        A Fortran-ordered (column-major) array gives contiguous column access.
+
+    Returns:
+        np.ndarray: Array of shape (8, k); rows are count, mean, std, min, 25%, 50%, 75%, max.
+                    Statistics are NaN for columns without values (std needs at least two).
+    """
+    k = X.shape[1]
+    out = np.full((8, k), np.nan)
+    for j in range(k):
+        col = X[:, j]
+        col = col[~np.isnan(col)]
+        n = col.shape[0]
+        out[0, j] = n
+        if n == 0:
+            continue
+        mean = col.mean()
+        s = np.sort(col)
+        out[1, j] = mean
+        if n > 1:
+            out[2, j] = np.sqrt(((col - mean) ** 2).sum() / (n - 1))
+        out[3, j] = s[0]
+        for i in range(3):
+            pos = 0.25 * (i + 1) * (n - 1)
+            lo = int(pos)
+            hi = min(lo + 1, n - 1)
+            out[4 + i, j] = s[lo] + (s[hi] - s[lo]) * (pos - lo)
+        out[7, j] = s[n - 1]
+    return out
+
+def histogram_block(X, bins=20):
+    """
+    Computes equal-width histograms for every column of a 2D array in one fused pass.
+    Bin edges are derived per column from its min and max, as np.histogram does. Every value
+    is then mapped to a global bin id (column offset + bin index), so one np.bincount call
+    counts all columns at once instead of re-binning each column separately.
+    Missing and infinite values are left out of the counts, as with ax.hist.
+
+    Args:
+        X (np.ndarray): 2D float array of shape (n, k).
+        bins (int): Number of equal-width bins per column.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Counts of shape (k, bins) and bin edges of shape (k, bins + 1).
+    """
+    k = X.shape[1]
+    finite = np.isfinite(X)
+    lows = np.min(X, axis=0, where=finite, initial=np.inf)
+    highs = np.max(X, axis=0, where=finite, initial=-np.inf)
+    # Columns without finite values get the range [0, 1], like np.histogram on empty input
+    empty = ~finite.any(axis=0)
+    lows = np.where(empty, 0.0, lows)
+    highs = np.where(empty, 1.0, highs)
+    # Constant columns get a unit-wide range centred on the value, like np.histogram
+    flat = lows == highs
+    lows = np.where(flat, lows - 0.5, lows)
+    highs = np.where(flat, highs + 0.5, highs)
+    edges = np.linspace(lows, highs, bins + 1, axis=1)
+
+    values = np.where(finite, X, lows)
+    bin_ids = ((values - lows) * (bins / (highs - lows))).astype(np.intp)
+    np.minimum(bin_ids, bins - 1, out=bin_ids) # The right edge belongs to the last bin
+    # Rounding in the scaling above can put a value lying exactly on an interior edge one bin off;
+    # compare against the actual edges and shift by one, as np.histogram does.
+    bin_ids -= values < np.take_along_axis(edges.T, bin_ids, axis=0)
+    bin_ids += (values >= np.take_along_axis(edges.T, bin_ids + 1, axis=0)) & (bin_ids != bins - 1)
+    bin_ids += np.arange(k) * bins
+    # Non-finite values get one extra, out-of-range id that is dropped after counting
+    bin_ids[~finite] = k * bins
+    counts = np.bincount(bin_ids.ravel(), minlength=k * bins + 1)[:k * bins].reshape(k, bins)
+    return counts, edges
+
+class OnlineCov:
+    """
+    Streaming accumulator for the covariance and correlation matrices of k variables.
+    Batches of rows are merged into running statistics (count, mean and the co-moment matrix M2)
+    with the numerically stable pairwise update of Chan et al., a batched form of Welford's algorithm.
+    Only one batch is ever held in memory, and each batch costs a single matrix product.
+    Rows with a missing value (NaN) in any column are dropped before merging (listwise deletion),
+    and their number is kept in 'dropped'. This equals pandas' DataFrame.dropna().corr(); it differs
+    from DataFrame.corr(), which drops missing values pair by pair, when columns miss different rows.
+
+    Args:
+        k (int): Number of variables (columns).
+    """
+    def __init__(self, k):
+        self.n = 0
+        self.dropped = 0
+        self.mean = np.zeros(k)
+        self.M2 = np.zeros((k, k))
+
+    def update(self, X):
+        """
+        Merges a batch of rows into the running statistics, skipping rows that contain NaN.
+
+        Args:
+            X (np.ndarray): 2D array of shape (m, k); computed in float64.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        complete = ~np.isnan(X).any(axis=1)
+        self.dropped += X.shape[0] - int(complete.sum())
+        X = X[complete]
+        m = X.shape[0]
+        if m == 0:
+            return
+        batch_mean = X.mean(axis=0)
+        centered = X - batch_mean
+        delta = batch_mean - self.mean
+        total = self.n + m
+        self.M2 += centered.T @ centered + np.outer(delta, delta) * (self.n * m / total)
+        self.mean += delta * (m / total)
+        self.n = total
+
+    def cov(self):
+        """
+        Returns:
+            np.ndarray: The (k, k) sample covariance matrix (ddof=1).
+        """
+        return self.M2 / (self.n - 1)
+
+    def corr(self):
+        """
+        Returns:
+            np.ndarray: The (k, k) Pearson correlation matrix.
+        """
+        cov = self.cov()
+        s = np.sqrt(np.diag(cov))
+        return cov / np.outer(s, s)
+
+def show_or_save(fig, name, save_dir=None):
+    """
+    Displays a figure, or saves it to disk when a save directory is given.
+
+    Args:
+        fig (matplotlib.figure.Figure): The figure to display or save.
+        name (str): File name (without extension) used when saving.
+        save_dir (str, optional): Directory to save the figure into as '<name>.png'.
+                                  If None, the figure is displayed with plt.show().
+
+    Side Effects:
+        Either displays the figure, or writes a PNG file and closes the figure.
+    """
+    if save_dir is None:
+        plt.show()
+    else:
+        fig.savefig(os.path.join(save_dir, f'{name}.png'), dpi=100)
+        plt.close(fig)
+
+def plot_initial_data(dataframe, save_dir=None):
     """
     Plots Temperature, pH, and COD time series data from the given DataFrame.
     Each variable is plotted on a separate subplot in a 3x1 layout.
@@ -51,131 +247,170 @@ def plot_initial_data(dataframe):
     Args:
         dataframe (pd.DataFrame): DataFrame containing 'Date', 'Temperature', 'pH', and 'cod' columns.
                                   'Date' column should be datetime objects.
+        save_dir (str, optional): If given, the figure is saved to this directory instead of displayed.
     
     Side Effects:
-        Displays a matplotlib plot with three subplots.
+        Displays (or saves) a matplotlib plot with three subplots.
     """
-    plt.figure(figsize=(14, 10)) # Adjusted figure size for 3 plots
+    fig, (ax_t, ax_ph, ax_cod) = plt.subplots(3, 1, figsize=(14, 10)) # Adjusted figure size for 3 plots
+    # Hand Matplotlib the raw datetime64 array so it keeps the column's own resolution.
+    # The series lines are drawn without antialiasing; axes and text keep it.
+    dates = dataframe['Date'].to_numpy()
 
     # Plot Temperature
-    plt.subplot(3, 1, 1)
-    plt.plot(dataframe['Date'], dataframe['Temperature'], label='Temperature', color='r')
-    plt.xlabel('Date')
-    plt.ylabel('Temperature (°C)')
-    plt.title('Temperature vs Time')
-    plt.legend()
-    plt.grid(True) # Added grid
+    ax_t.plot(dates, dataframe['Temperature'], label='Temperature', color='r', rasterized=True, antialiased=False)
+    ax_t.set_xlabel('Date')
+    ax_t.set_ylabel('Temperature (°C)')
+    ax_t.set_title('Temperature vs Time')
+    ax_t.legend()
+    ax_t.grid(True) # Added grid
 
     # Plot pH
-    plt.subplot(3, 1, 2)
-    plt.plot(dataframe['Date'], dataframe['pH'], label='pH', color='b')
-    plt.xlabel('Date')
-    plt.ylabel('pH')
-    plt.title('pH vs Time')
-    plt.legend()
-    plt.grid(True) # Added grid
+    ax_ph.plot(dates, dataframe['pH'], label='pH', color='b', rasterized=True, antialiased=False)
+    ax_ph.set_xlabel('Date')
+    ax_ph.set_ylabel('pH')
+    ax_ph.set_title('pH vs Time')
+    ax_ph.legend()
+    ax_ph.grid(True) # Added grid
 
     # Plot cod
-    plt.subplot(3, 1, 3)
-    plt.plot(dataframe['Date'], dataframe['cod'], label='COD', color='g')
-    plt.xlabel('Date')
-    plt.ylabel('COD')
-    plt.title('COD vs Time')
-    plt.legend()
-    plt.grid(True) # Added grid
-
-    # Adjust layout and show plot
-    plt.tight_layout()
-    plt.show() # Added plt.show()
-
-def perform_univariate_eda(dataframe):
+    ax_cod.plot(dates, dataframe['cod'], label='COD', color='g', rasterized=True, antialiased=False)
+    ax_cod.set_xlabel('Date')
+    ax_cod.set_ylabel('COD')
+    ax_cod.set_title('COD vs Time')
+    ax_cod.legend()
+    ax_cod.grid(True) # Added grid
+
+    # Set the axis limits explicitly from precomputed extremes (one reduction over the numeric
+    # block, shared by all three subplots) instead of having Matplotlib derive them from each
+    # line's data. set_xlim/set_ylim also switch autoscaling off for each axis. Both axes keep
+    # Matplotlib's default 5% margin. Like autoscaling, the extremes ignore NaN/inf (and NaT)
+    # values; an axis without a finite, non-zero range is left to autoscaling.
+    values = dataframe[['Temperature', 'pH', 'cod']].to_numpy(dtype=np.float64)
+    finite = np.isfinite(values)
+    lows = np.min(values, axis=0, where=finite, initial=np.inf)
+    highs = np.max(values, axis=0, where=finite, initial=-np.inf)
+    valid_dates = dates[~np.isnat(dates)]
+    for i, ax in enumerate((ax_t, ax_ph, ax_cod)):
+        if valid_dates.size and valid_dates.min() < valid_dates.max():
+            date_margin = 0.05 * (valid_dates.max() - valid_dates.min())
+            ax.set_xlim(valid_dates.min() - date_margin, valid_dates.max() + date_margin)
+        if lows[i] < highs[i]: # False for all-missing and constant columns
+            margin = 0.05 * (highs[i] - lows[i])
+            ax.set_ylim(lows[i] - margin, highs[i] + margin)
+
+    # Adjust layout and show (or save) plot
+    fig.tight_layout()
+    show_or_save(fig, 'time_series', save_dir)
+
+def perform_univariate_eda(dataframe, save_dir=None):
     """
     Performs univariate EDA by plotting histograms and box plots for Temperature, pH, and COD.
+    All plots share one figure: one row per column, histogram on the left and box plot on the right.
 
     Args:
         dataframe (pd.DataFrame): DataFrame containing 'Temperature', 'pH', and 'cod' columns.
+        save_dir (str, optional): If given, the figure is saved to this directory instead of displayed.
 
     Side Effects:
-        Displays histograms and box plots for each specified column.
+        Displays (or saves) a single figure with a histogram and a box plot for each specified column.
     """
     numerical_cols = ['Temperature', 'pH', 'cod']
-    for col in numerical_cols:
-        # Plot Histogram
-        plt.figure(figsize=(8, 6))
-        plt.hist(dataframe[col], bins=20, color='skyblue', edgecolor='black')
-        plt.title(f'Distribution of {col}')
-        plt.xlabel(col)
-        plt.ylabel('Frequency')
-        plt.tight_layout()
-        plt.show()
+    X = dataframe[numerical_cols].to_numpy(dtype=np.float64)
+    counts, edges = histogram_block(X, bins=20)
+
+    fig, axes = plt.subplots(len(numerical_cols), 2, figsize=(12, 10))
+    for i, col in enumerate(numerical_cols):
+        values = X[:, i]
+
+        # Plot Histogram (pre-binned, so Matplotlib only draws the bars)
+        axes[i, 0].bar(edges[i, :-1], counts[i], width=np.diff(edges[i]), align='edge',
+                       color='skyblue', edgecolor='black')
+        axes[i, 0].set_title(f'Distribution of {col}')
+        axes[i, 0].set_xlabel(col)
+        axes[i, 0].set_ylabel('Frequency')
 
         # Plot Box Plot
-        plt.figure(figsize=(8, 6))
-        plt.boxplot(dataframe[col], vert=False, patch_artist=True, boxprops=dict(facecolor='lightgreen'))
-        plt.title(f'Box Plot of {col}')
-        plt.xlabel(col) # For horizontal boxplot, this is the value axis
-        plt.yticks([]) # Hide Y-axis ticks for horizontal boxplot if only one variable
-        plt.tight_layout()
-        plt.show()
+        axes[i, 1].boxplot(values, vert=False, patch_artist=True, boxprops=dict(facecolor='lightgreen'))
+        axes[i, 1].set_title(f'Box Plot of {col}')
+        axes[i, 1].set_xlabel(col) # For horizontal boxplot, this is the value axis
+        axes[i, 1].set_yticks([]) # Hide Y-axis ticks for horizontal boxplot if only one variable
+
+    fig.tight_layout()
+    show_or_save(fig, 'univariate', save_dir)
 
-def perform_bivariate_eda(dataframe):
+def perform_bivariate_eda(dataframe, save_dir=None, batch_size=100_000):
     """
-    Performs bivariate EDA: generates scatter plots for pairs of variables,
+    Performs bivariate EDA: generates scatter plots for pairs of variables (side by side in one figure),
     prints a correlation matrix, and attempts to display a heatmap of the matrix.
 
     Args:
         dataframe (pd.DataFrame): DataFrame containing 'Temperature', 'pH', and 'cod' columns.
+        save_dir (str, optional): If given, the figures are saved to this directory instead of displayed.
+        batch_size (int): Number of rows converted and accumulated at a time for the correlation matrix.
 
     Side Effects:
-        Displays scatter plots and potentially a heatmap. Prints the correlation matrix.
+        Displays (or saves) scatter plots and potentially a heatmap. Prints the correlation matrix.
     """
     numerical_cols = ['Temperature', 'pH', 'cod']
     pairs = [('Temperature', 'pH'), ('Temperature', 'cod'), ('pH', 'cod')]
 
-    # Scatter Plots
-    for col1, col2 in pairs:
-        plt.figure(figsize=(8, 6))
-        plt.scatter(dataframe[col1], dataframe[col2], alpha=0.5)
-        plt.title(f'{col1} vs. {col2}')
-        plt.xlabel(col1)
-        plt.ylabel(col2)
-        plt.grid(True)
-        plt.tight_layout()
-        plt.show()
+    # Scatter Plots (one shared figure, one subplot per pair)
+    fig, axes = plt.subplots(1, len(pairs), figsize=(18, 6))
+    for ax, (col1, col2) in zip(axes, pairs):
+        # Uniform markers via plot() take Matplotlib's fast marker path instead of a per-point PathCollection
+        ax.plot(dataframe[col1].to_numpy(), dataframe[col2].to_numpy(), marker='.', linestyle='none', alpha=0.5)
+        ax.set_title(f'{col1} vs. {col2}')
+        ax.set_xlabel(col1)
+        ax.set_ylabel(col2)
+        ax.grid(True)
+    fig.tight_layout()
+    show_or_save(fig, 'scatter_pairs', save_dir)
 
     # Correlation Matrix
     print("\nCorrelation Matrix:")
-    correlation_matrix = dataframe[numerical_cols].corr()
-    print(correlation_matrix)
+    # Accumulate the co-moments batch by batch, so only one float64 batch of the float32 data
+    # is materialized at a time; each batch is a single X.T @ X matrix product.
+    numeric = dataframe[numerical_cols]
+    accumulator = OnlineCov(len(numerical_cols))
+    for start in range(0, len(numeric), batch_size):
+        accumulator.update(numeric.iloc[start:start + batch_size].to_numpy(dtype=np.float64))
+    # The ndarray C is computed once and shared by the printout and the heatmap below.
+    C = accumulator.corr()
+    if accumulator.dropped:
+        print(f"Note: {accumulator.dropped} row(s) with missing values were left out of the correlation matrix.")
+    print(pd.DataFrame(C, index=numerical_cols, columns=numerical_cols))
 
     # Heatmap (Optional - attempting with seaborn)
     try:
-        plt.figure(figsize=(8, 6))
-        sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', fmt=".2f", linewidths=.5)
+        fig = plt.figure(figsize=(8, 6))
+        # Pass the raw ndarray (no DataFrame wrapper) with explicit tick labels, and fix the
+        # '%.2f' cell labels up front; fmt='' makes seaborn use those labels unchanged.
+        annot_labels = np.char.mod('%.2f', C)
+        sns.heatmap(C, annot=annot_labels, fmt='', annot_kws={'size': 8}, cmap='coolwarm', linewidths=.5,
+                    xticklabels=numerical_cols, yticklabels=numerical_cols, cbar=True)
         plt.title('Correlation Heatmap')
         plt.tight_layout()
-        plt.show()
+        show_or_save(fig, 'correlation_heatmap', save_dir)
     except Exception as e:
         print(f"\nCould not generate heatmap, possibly due to missing seaborn or other error: {e}")
         print("Seaborn is an optional dependency for heatmap visualization.")
 
 if __name__ == '__main__':
+    # In headless mode, plots are written to PLOT_DIR (default: 'plots') instead of being shown.
+    save_dir = None
+    if HEADLESS:
+        save_dir = os.environ.get('PLOT_DIR', 'plots')
+        os.makedirs(save_dir, exist_ok=True)
+
     # --- Data Generation ---
     # Generate synthetic data and save it to a CSV file.
-    # The returned DataFrame is assigned to '_' as its direct use is not immediately needed
-    # because the script proceeds to load data from the CSV for subsequent steps.
+    # The returned DataFrame is used directly for all subsequent steps; the CSV is
+    # written for later use and is not read back, which avoids a pointless disk round-trip.
     print("--- Data Generation ---")
-    _ = generate_and_save_data('time_series_dataset.csv')
+    loaded_data = generate_and_save_data('time_series_dataset.csv')
     print("--- End of Data Generation ---\n")
 
-    # --- Data Loading ---
-    print("--- Data Loading ---")
-    # Load the data from the CSV file.
-    # 'parse_dates=['Date']' ensures the 'Date' column is read as datetime objects.
-    loaded_data = pd.read_csv('time_series_dataset.csv', parse_dates=['Date'])
-    print("Data loaded successfully from time_series_dataset.csv")
-    print("--- End of Data Loading ---\n")
-
     # Display the first few rows of the loaded dataset (original optional verification)
     # print("Loaded data from CSV head:") # This was the original head print (now part of Data Inspection)
     # print(loaded_data.head()) # This was the original head print (now part of Data Inspection)
@@ -183,6 +418,7 @@ if __name__ == '__main__':
     # --- Data Inspection ---
     # Basic inspection of the loaded DataFrame.
     print("--- Data Inspection ---")
+    numerical_cols = ['Temperature', 'pH', 'cod']
 
     print("\nFirst 5 rows (loaded_data.head()):")
     print(loaded_data.head())
@@ -194,8 +430,19 @@ if __name__ == '__main__':
     # .info() prints summary directly to stdout, including dtype and non-null counts.
     loaded_data.info()
 
-    print("\nDescriptive Statistics (loaded_data.describe()):")
-    print(loaded_data.describe())
+    if pl is not None:
+        print("\nDescriptive Statistics (Polars describe()):")
+        # Hand the numeric columns to Polars and let its multi-threaded Rust kernels compute the
+        # statistics. Only the numeric columns are passed and the null_count row is dropped (missing
+        # values are reported below), so the table has the same rows and columns as describe_block's.
+        stats = pl.from_pandas(loaded_data[numerical_cols]).describe(interpolation='linear')
+        print(stats.filter(pl.col('statistic') != 'null_count'))
+    else:
+        print("\nDescriptive Statistics (describe_block):")
+        # All statistics for all numeric columns are computed in one compiled pass over a column-major block.
+        stats = describe_block(np.asfortranarray(loaded_data[numerical_cols].to_numpy(dtype=np.float64)))
+        print(pd.DataFrame(stats, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+                           columns=numerical_cols))
 
     print("--- End of Data Inspection ---\n")
 
@@ -203,7 +450,12 @@ if __name__ == '__main__':
     # Checking for any missing values in the dataset.
     print("--- Missing Value Check ---")
     print("\nMissing Values per Column:")
-    print(loaded_data.isnull().sum())
+    # The numeric columns are checked with one np.isnan reduction over a single float block;
+    # 'Date' is datetime64, so it keeps the pandas isna() check.
+    numeric_nans = np.isnan(loaded_data[numerical_cols].to_numpy()).sum(axis=0)
+    missing_counts = pd.Series([loaded_data['Date'].isna().sum(), *numeric_nans],
+                               index=['Date', *numerical_cols])
+    print(missing_counts)
 
     # Placeholder for Imputation Strategy.
     # If missing values were present and significant, appropriate imputation
@@ -218,21 +470,22 @@ if __name__ == '__main__':
     # --- Univariate EDA ---
     # Performing univariate analysis on key numerical columns.
     print("--- Univariate EDA ---")
-    perform_univariate_eda(loaded_data)
+    perform_univariate_eda(loaded_data, save_dir)
     print("--- End of Univariate EDA ---\n")
 
     # --- Bivariate EDA ---
     # Performing bivariate analysis to understand relationships between variables.
     print("--- Bivariate EDA ---")
-    perform_bivariate_eda(loaded_data)
+    perform_bivariate_eda(loaded_data, save_dir)
     print("--- End of Bivariate EDA ---\n")
 
     # --- Initial Time Series Plotting ---
     # Plotting the original time series data for Temperature, pH, and COD.
     print("--- Initial Time Series Plotting ---")
-    plot_initial_data(loaded_data)
+    plot_initial_data(loaded_data, save_dir)
     print("--- End of Initial Time Series Plotting ---")
     
-    # Note: plt.show() is called within each plotting function 
+    # Note: show_or_save() is called within each plotting function 
     # (plot_initial_data, perform_univariate_eda, perform_bivariate_eda)
-    # to display plots immediately after they are generated for that specific EDA step.
+    # to display (or, in headless mode, save) plots immediately after they are generated
+    # for that specific EDA step.